@@ -20,8 +20,9 @@ except AttributeError:
 
 # --- 2. Define the Fixed Logic ---
 def _fixed_next_page_info(self) -> PageInfo | None:
-    current_page = self.result_info.page
-    total_pages = getattr(self.result_info, "total_pages", None)  # Safe access
+    result_info = self.result_info  # One model attribute lookup per page instead of two
+    current_page = result_info.page
+    total_pages = getattr(result_info, "total_pages", None)  # Safe access; the SDK builds pages without validation
 
     if current_page is None:
         return None
@@ -301,10 +301,10 @@ class Mapping(NamedTuple):
             >>> Mapping.from_str("app.com=localhost:8000")
             Mapping(domain='app.com', service='localhost:8000')
         """
-        if "=" not in pair:
+        domain_str, separator, service_str = pair.partition("=")  # One scan for both the check and the split
+        if not separator:
             raise ValueError(f"Invalid mapping '{pair}'. Expected format 'domain.com=target_url'")
 
-        domain_str, service_str = pair.split("=", 1)
         return cls.from_pair(domain_str, service_str)
 
     def ingress(self) -> ConfigIngress:
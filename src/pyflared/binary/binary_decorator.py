@@ -20,6 +20,7 @@ class BinaryApp:
             stream_chunker: StreamChunker | None = None,  # This is also a good place to add logger if needed
             fixed_input: str | None = None,
             responders: list[Responder] | None = None,
+            merge_stderr: bool = False,  # Everything then arrives tagged as STDOUT
     ) -> Callable[[ProcessTargetable[P]], FinalCmdFun[P]]:
         def decorator(func: ProcessTargetable[P]) -> FinalCmdFun[P]:
             @wraps(func)
@@ -33,6 +34,7 @@ class BinaryApp:
                     fixed_input=fixed_input,
                     guards=guards,
                     default_responders=responders,
+                    merge_stderr=merge_stderr,
                 )
 
             return wrapper
@@ -81,12 +83,11 @@ class BinaryApp:
     async def concatenate_stdout(cls, process_context: ProcessContext) -> str:
         sout_buffer: list[bytes] = []
         err_buffer: list[bytes] = []
+        # Channel -> bound append, so each chunk is a single dict lookup instead of an enum comparison
+        appenders = {OutputChannel.STDOUT: sout_buffer.append, OutputChannel.STDERR: err_buffer.append}
 
         def concatenate(data: bytes, channel: OutputChannel):
-            if channel == OutputChannel.STDOUT:
-                sout_buffer.append(data)
-            else:
-                err_buffer.append(data)
+            appenders[channel](data)
 
         returncode = await process_context.start_background([concatenate])
 
@@ -1,16 +1,17 @@
 import asyncio
 import contextlib
+import os
 from collections.abc import AsyncGenerator, Iterable
 from dataclasses import dataclass, field
 from types import TracebackType
 from typing import override
 
 from pyflared.binary.process_instance import ProcessInstance
+from pyflared.binary.reader import READ_CHUNK_SIZE, READ_LIMIT
+from pyflared.binary.writer import classify_responders
 from loguru import logger
 
 from pyflared.shared.types import (
-    CmdArg,
-    CmdArgs,
     ProcessCmd,
     CommandError,
     Guard,
@@ -18,7 +19,6 @@ from pyflared.shared.types import (
     StreamChunker, BinaryCallable,
 )
 from pyflared.utils.asyncio.wait import safe_awaiter
-from pyflared.utils.type_check import is_of_type
 
 
 @dataclass
@@ -35,15 +35,22 @@ class ProcessContext(contextlib.AbstractAsyncContextManager[ProcessInstance]):
 
     fixed_input: str | None = None
     default_responders: list[Responder] | None = None
+    read_chunk_size: int = READ_CHUNK_SIZE  # Bytes per pipe read; lower it for chatty interactive children
+    # StreamReader buffer limit, and the longest line read; the transport stops reading the pipe once 2x this is
+    # buffered unread
+    read_limit: int = READ_LIMIT
+    # Route stderr into the stdout pipe: one pipe and one reader for children whose channels nobody tells apart
+    merge_stderr: bool = False
 
     # Internal State # field is used for non-constructor properties
-    process: asyncio.subprocess.Process | None = field(default=None, init=False)
     running_process: ProcessInstance | None = field(default=None, init=False)
 
     async def _validate_guards(self):
         if self.guards:
-            for guard in self.guards:
-                if not await safe_awaiter(guard()):
+            # Guards are independent checks, so I/O-bound ones overlap; failures are still reported in declared order
+            results = await asyncio.gather(*(safe_awaiter(guard()) for guard in self.guards))
+            for guard, passed in zip(self.guards, results):
+                if not passed:
                     raise CommandError(f"Precondition failed: {guard.__name__}")
 
     @override
@@ -52,12 +59,13 @@ class ProcessContext(contextlib.AbstractAsyncContextManager[ProcessInstance]):
             raise RuntimeError("Process already started once")
 
         # 1. Prepare Args
+        # Plain isinstance checks: beartype would walk the generic/union hints on every spawn for the same answer
         ags = self.cmd_args
-        if is_of_type(ags, AsyncGenerator[CmdArgs, None]):
+        if isinstance(ags, AsyncGenerator):
             ags = await anext(ags)
 
         args = await safe_awaiter(ags)
-        if is_of_type(args, CmdArg):
+        if isinstance(args, (str, bytes, os.PathLike)):  # A single CmdArg
             args = [args]
 
         # 2. Validation
@@ -69,11 +77,14 @@ class ProcessContext(contextlib.AbstractAsyncContextManager[ProcessInstance]):
         process = await asyncio.create_subprocess_exec(
             self.binary_path(), *args,
             stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-            stdin=asyncio.subprocess.PIPE
+            stderr=asyncio.subprocess.STDOUT if self.merge_stderr else asyncio.subprocess.PIPE,
+            stdin=asyncio.subprocess.PIPE,
+            limit=self.read_limit,
         )
 
-        self.running_process = ProcessInstance(process, self.fixed_input, self.stream_chunker, self.default_responders)
+        self.running_process = ProcessInstance(
+            process, self.fixed_input, self.stream_chunker, self.default_responders, self.read_chunk_size,
+            self.read_limit)
         return self.running_process
 
     @override
@@ -89,9 +100,13 @@ class ProcessContext(contextlib.AbstractAsyncContextManager[ProcessInstance]):
 
     # `responders` is also a good place to add logger if needed
     async def start_background(self, responders: Iterable[Responder] | None = None) -> int | None:
+        # The pipeline already runs default_responders on every chunk; passing the same list again would run them twice
+        classified = classify_responders(None if responders is self.default_responders else responders)
         async with self as service:
-            async for event in service:
-                if responders:
-                    await service.write_from_responders(event.data, event.channel, responders)
+            if not classified:
+                return await service.drain_wait()
+
+            async for data, channel in service:
+                await service.write_from_classified(data, channel, classified)
                 # logger.debug(event)
             return await service.wait()
@@ -3,7 +3,7 @@ from collections.abc import AsyncIterable, AsyncIterator, Callable
 from dataclasses import dataclass
 from typing import override, Self
 
-from pyflared.binary.reader import combined_output
+from pyflared.binary.reader import READ_CHUNK_SIZE, READ_LIMIT, channel_output, combined_output
 from pyflared.binary.writer import ProcessWriter
 from pyflared.shared.types import ProcessOutput, StreamChunker, Responder, OutputChannel, AwaitableMaybe
 
@@ -15,30 +15,43 @@ class ProcessInstance(ProcessWriter, AsyncIterable[ProcessOutput]):
     fixed_input: str | None
     chunker: StreamChunker | None = None
     responders: list[Responder] | None = None
+    read_chunk_size: int = READ_CHUNK_SIZE
+    read_limit: int = READ_LIMIT
 
     @override
     def __aiter__(self) -> AsyncIterator[ProcessOutput]:
-        return combined_output(self, self.fixed_input, self.chunker, self.responders)
+        return combined_output(
+            self, self.fixed_input, self.chunker, self.responders, self.read_chunk_size, self.read_limit)
 
-    async def stdout_only(self) -> AsyncIterator[bytes]:
+    def stdout_only(self) -> AsyncIterator[bytes]:
         """Yields only stdout, but drains stderr."""
-        async for output in self:
-            if output.channel == OutputChannel.STDOUT:
-                yield output.data
+        return self.iter_channel(OutputChannel.STDOUT)
 
-    async def stderr_only(self) -> AsyncIterator[bytes]:
+    def stderr_only(self) -> AsyncIterator[bytes]:
         """Yields only stderr, but drains stdout."""
-        async for output in self:
-            if output.channel == OutputChannel.STDERR:
-                yield output.data
+        return self.iter_channel(OutputChannel.STDERR)
+
+    def iter_channel(self, channel: OutputChannel) -> AsyncIterator[bytes]:
+        """Yields one channel's chunks; the other is still drained and, if there are responders, answered."""
+        if not self.responders:  # Nothing needs to see both channels, so read the wanted pipe directly
+            return channel_output(self, channel, self.fixed_input, self.chunker, self.read_chunk_size, self.read_limit)
+        return self._responding_channel(channel)
+
+    async def _responding_channel(self, channel: OutputChannel) -> AsyncIterator[bytes]:
+        outputs = combined_output(
+            self, self.fixed_input, self.chunker, self.responders, self.read_chunk_size, self.read_limit, only=channel)
+        async for data, _ in outputs:
+            yield data
 
     async def pipe_to(self, target: Self, mutator: Mutator | None = None) -> None:
         """Pipes the output of this process to another process."""
+        if not mutator:  # Plain stdout forwarding takes the direct single-pipe path
+            async for data in self.stdout_only():
+                await target.write(data)
+            return
+
         async for output in self:
-            if mutator:
-                await target.write(mutator(output))
-            elif output.channel == OutputChannel.STDOUT:
-                await target.write(output.data)
+            await target.write(mutator(output))
 
     async def drain_wait(self) -> int:
         """Drains all output and waits until the process completes."""
@@ -61,7 +74,8 @@ class ProcessInstance(ProcessWriter, AsyncIterable[ProcessOutput]):
 
             try:
                 self.process.terminate()
-                _ = await asyncio.wait_for(self.process.wait(), timeout=2.0)
+                async with asyncio.timeout(2.0):
+                    _ = await self.process.wait()
             except ProcessLookupError:
                 # Process already dead
                 pass
@@ -1,46 +1,167 @@
 import asyncio
-from collections.abc import AsyncIterator
+import inspect
+from collections.abc import AsyncIterator, Awaitable
+from typing import Final, cast
 
-from pyflared.binary.writer import ProcessWriter
-from pyflared.shared.types import ProcessOutput, StreamChunker, Responder, OutputChannel, ChunkSignal
-from pyflared.utils.asyncio.async_Iterable import yield_from_async
+from pyflared.binary.writer import ProcessWriter, classify_responders
+from pyflared.shared.types import Chunk, ProcessOutput, StreamChunker, Responder, OutputChannel, ChunkSignal
 from pyflared.utils.asyncio.merge import merge_async_iterators
 from pyflared.utils.asyncio.wait import safe_awaiter
 from pyflared.utils.iterable import not_none_generator
 
+# Matches the default Linux pipe buffer, so one read usually drains whatever the child has written so far
+READ_CHUNK_SIZE: Final[int] = 1 << 16
+# Longest line accepted, and the StreamReader limit ProcessContext spawns with by default
+READ_LIMIT: Final[int] = 1 << 20
+
+
+def _line_too_long(limit: int) -> ValueError:
+    return ValueError(f"Line longer than the {limit} byte limit")
+
+
+async def read_lines(
+        stream: asyncio.StreamReader, chunk_size: int = READ_CHUNK_SIZE, limit: int = READ_LIMIT,
+) -> AsyncIterator[bytes]:
+    """
+    Same lines as `async for line in stream`, but pulled in bulk reads.
+    Complete lines are sliced straight out of each read; only a partial tail is carried over in a bytearray.
+    Like readline, a line longer than `limit` raises ValueError, so a child writing without newlines
+    can't grow the tail without bound.
+    """
+    # No read is larger than the limit, so a line found whole inside one read never needs checking; only the tail does
+    chunk_size = min(chunk_size, limit)
+    tail = bytearray()
+    while chunk := await stream.read(chunk_size):
+        start = 0
+        if tail:
+            if not (start := chunk.find(b"\n") + 1):
+                tail += chunk
+                if len(tail) > limit:
+                    raise _line_too_long(limit)
+                continue
+            if len(tail) + start - 1 > limit:  # Newline excluded, as readline counts it
+                raise _line_too_long(limit)
+            tail += memoryview(chunk)[:start]
+            yield bytes(tail)
+            tail.clear()
+
+        while end := chunk.find(b"\n", start) + 1:
+            yield chunk[start:end]
+            start = end
+        tail += memoryview(chunk)[start:]
+
+    if tail:  # Trailing line without a newline
+        yield bytes(tail)
+
 
 async def reader_chunker(
         stream: asyncio.StreamReader, output_channel: OutputChannel,
-        chunker: StreamChunker) -> AsyncIterator[bytes]:
-    while True:
-        chunk = await safe_awaiter(chunker(stream, output_channel))
-        match chunk:
-            case bytes():
-                yield chunk
-            case ChunkSignal.SKIP:
-                continue
-            case ChunkSignal.EOF:
-                break
+        chunker: StreamChunker, chunk_size: int = READ_CHUNK_SIZE, limit: int = READ_LIMIT) -> AsyncIterator[bytes]:
+    # Chunkers are nearly always coroutine functions; decide once instead of isawaitable-checking every line
+    is_async = inspect.iscoroutinefunction(chunker)
+    async for line in read_lines(stream, chunk_size, limit):
+        chunk = chunker(line, output_channel)
+        if is_async:
+            chunk = await cast(Awaitable[Chunk], chunk)
+        elif type(chunk) is not bytes and type(chunk) is not ChunkSignal:  # Plain callables only await if they must
+            chunk = await safe_awaiter(chunk)
+        # Bytes first, then identity checks: cheaper per line than match's class/value patterns
+        if type(chunk) is bytes:
+            yield chunk
+        elif chunk is ChunkSignal.EOF:
+            break
 
 
-@yield_from_async
-async def combined_output(
+def combined_output(
         process_writer: ProcessWriter,
         initial_input: str | None = None,
         chunker: StreamChunker | None = None,
-        responders: list[Responder] | None = None
-):
-    if initial_input:
-        await process_writer.write(initial_input)
+        responders: list[Responder] | None = None,
+        chunk_size: int = READ_CHUNK_SIZE,
+        limit: int = READ_LIMIT,
+        only: OutputChannel | None = None,
+) -> AsyncIterator[ProcessOutput]:
+    """
+    Both channels, tagged and merged. With `only`, the other channel is still read and answered by responders,
+    but its chunks are dropped at the source instead of travelling through the merge queue.
+    """
+    classified = classify_responders(responders)
+    # NamedTuple's generated __new__ is a Python frame; tuple.__new__ builds the identical ProcessOutput without it
+    tag = tuple.__new__
+
+    async def channel_tagger(stream: asyncio.StreamReader, channel: OutputChannel, prelude: str | None = None):
+        if prelude:
+            await process_writer.write(prelude)
+
+        chunked_source = chunker and reader_chunker(stream, channel, chunker, chunk_size, limit) \
+            or read_lines(stream, chunk_size, limit)
+        emit = only is None or channel is only
+        if not classified:  # The common case: no responder await per chunk at all
+            async for chunk in chunked_source:
+                if emit:
+                    yield tag(ProcessOutput, (chunk, channel))
+            return
 
-    async def channel_tagger(stream: asyncio.StreamReader, channel: OutputChannel):
-        chunked_source = chunker and reader_chunker(stream, channel, chunker) or stream
         async for chunk in chunked_source:
-            await process_writer.write_from_responders(chunk, channel, responders or [])
-            yield ProcessOutput(chunk, channel)
+            await process_writer.write_from_classified(chunk, channel, classified)
+            if emit:
+                yield tag(ProcessOutput, (chunk, channel))
 
+    # The merge is handed back directly rather than re-yielded through another generator layer;
+    # the initial input rides on whichever reader starts first
+    sout, serr = process_writer.process.stdout, process_writer.process.stderr
     sources = not_none_generator(
-        (sout := process_writer.process.stdout) and channel_tagger(sout, OutputChannel.STDOUT),
-        (serr := process_writer.process.stderr) and channel_tagger(serr, OutputChannel.STDERR)
+        sout and channel_tagger(sout, OutputChannel.STDOUT, initial_input),
+        serr and channel_tagger(serr, OutputChannel.STDERR, None if sout else initial_input)
     )
     return merge_async_iterators(*sources)
+
+
+async def channel_output(
+        process_writer: ProcessWriter,
+        channel: OutputChannel,
+        initial_input: str | None = None,
+        chunker: StreamChunker | None = None,
+        chunk_size: int = READ_CHUNK_SIZE,
+        limit: int = READ_LIMIT,
+) -> AsyncIterator[bytes]:
+    """
+    Chunks of one channel straight off its pipe: no tagging, no merge queue, no responders.
+    The other pipe is still read to the end (through the chunker, if any) so the child never blocks on it.
+    """
+    process = process_writer.process
+    wanted, other = (process.stdout, process.stderr) if channel is OutputChannel.STDOUT \
+        else (process.stderr, process.stdout)
+    other_channel = OutputChannel.STDERR if channel is OutputChannel.STDOUT else OutputChannel.STDOUT
+
+    async def discard(stream: asyncio.StreamReader):
+        if chunker:
+            async for _ in reader_chunker(stream, other_channel, chunker, chunk_size, limit):
+                pass
+        else:
+            while await stream.read(chunk_size):
+                pass
+
+    if initial_input:
+        await process_writer.write(initial_input)
+
+    def surface_failure(task: asyncio.Task[None]):
+        # A failed drainer leaves the other pipe unread, so the child can block on it and the wanted pipe
+        # would never reach EOF; fail the wanted reader with the same error instead of waiting forever
+        if wanted and not task.cancelled() and (exc := task.exception()):
+            wanted.set_exception(exc)  # pyright: ignore[reportArgumentType]
+
+    drainer = other and asyncio.create_task(discard(other))
+    if drainer:
+        drainer.add_done_callback(surface_failure)
+    try:
+        if wanted:
+            source = chunker and reader_chunker(wanted, channel, chunker, chunk_size, limit) \
+                or read_lines(wanted, chunk_size, limit)
+            async for chunk in source:
+                yield chunk
+        if drainer:
+            await drainer
+    finally:
+        if drainer and not drainer.done():
+            _ = drainer.cancel()
@@ -1,10 +1,21 @@
 import asyncio
-from collections.abc import Iterable
+import inspect
+from collections.abc import Awaitable, Iterable
 from dataclasses import dataclass
+from typing import cast
 
-from pyflared.shared.types import AwaitableMaybe, OutputChannel, Responder
+from pyflared.shared.types import AwaitableMaybe, OutputChannel, Responder, Response
 from pyflared.utils.asyncio.wait import safe_awaiter
 
+type ClassifiedResponders = tuple[tuple[Responder, bool], ...]
+
+
+def classify_responders(responders: Iterable[Responder] | None) -> ClassifiedResponders:
+    """
+    Pairs each responder with whether it is a coroutine function, so the per-chunk loop can skip isawaitable checks.
+    """
+    return tuple((responder, inspect.iscoroutinefunction(responder)) for responder in responders or ())
+
 
 @dataclass
 class ProcessWriter:
@@ -15,11 +26,34 @@ class ProcessWriter:
         if not self.process.stdin:
             return
 
-        try:
+        if type(data) is not bytes and type(data) is not str:  # Ready data skips the isawaitable check
             data = await safe_awaiter(data)
-            if isinstance(data, str):
-                data = data.encode()
+        if self._put(data):
+            await self._drain()
+
+    def _put(self, data: str | bytes) -> bool:
+        """Hands data to the stdin transport without draining. False when there is no stdin to write to."""
+        if not self.process.stdin:
+            return False
+
+        if isinstance(data, str):
+            data = data.encode()
+        try:
             self.process.stdin.write(data)
+        except BrokenPipeError:
+            return False
+        return True
+
+    async def _drain(self) -> None:
+        if not self.process.stdin:
+            return
+
+        # drain() only ever waits once the transport is paused above its high-water mark; below that it is a no-op
+        transport = self.process.stdin.transport
+        if transport.get_write_buffer_size() < transport.get_write_buffer_limits()[1]:
+            return
+
+        try:
             await self.process.stdin.drain()
         except BrokenPipeError:
             pass
@@ -29,7 +63,19 @@ class ProcessWriter:
         await self.write(line)
 
     async def write_from_responders(self, chunk: bytes, channel: OutputChannel, responders: Iterable[Responder]):
-        for responder in responders:
-            response = await safe_awaiter(responder(chunk, channel))
+        await self.write_from_classified(chunk, channel, classify_responders(responders))
+
+    async def write_from_classified(self, chunk: bytes, channel: OutputChannel, responders: ClassifiedResponders):
+        wrote = False
+        for responder, is_async in responders:
+            response = responder(chunk, channel)
+            if is_async:
+                response = await cast(Awaitable[Response], response)
+            elif response is not None:  # A plain callable may still hand back an awaitable
+                response = await safe_awaiter(response)
             if response is not None:
-                await self.write(response)
+                wrote = self._put(response) or wrote
+
+        # Replies to one chunk go out together: a single drain instead of one per responder
+        if wrote:
+            await self._drain()
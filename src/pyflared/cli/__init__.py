@@ -1,8 +1,7 @@
-import asyncio
-
 import typer
 
 import pyflared
+from pyflared.utils.asyncio.run import run
 from .ssh import ssh_manager
 from .token import token_manager
 from .tunnel import tunnel_manager
@@ -17,7 +16,7 @@ app.add_typer(token_manager, name="token")
 @app.command()
 def version():
     """Show version info."""
-    v: str = asyncio.run(pyflared.binary_version())
+    v: str = run(pyflared.binary_version())
     typer.echo(v)
 
 # @app.command()
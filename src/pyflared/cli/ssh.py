@@ -1,4 +1,3 @@
-import asyncio
 import logging
 import os
 import shlex
@@ -21,6 +20,7 @@ from pyflared.log.config import isolated_logging
 from pyflared.ssh.config import SSHConfig
 from pyflared.ssh.exists import check_sshd_status, SshdStatus
 from pyflared.utils.pydantic_parse import pydantic_typer_parse
+from pyflared.utils.asyncio.run import run
 
 ssh_manager = typer.Typer(help="Cloudflared ssh")
 
@@ -56,7 +56,7 @@ def serve(
             tunnel_name=tunnel_name,
             force=force,
         )
-        _ = asyncio.run(tunnel.start_background([pretty_tunnel_status]))
+        _ = run(tunnel.start_background([pretty_tunnel_status]))
 
 
 # Client side
@@ -1,10 +1,9 @@
-import asyncio
-
 import typer
 from typing_extensions import Annotated
 
 from pyflared.core.model import Token
 from pyflared.core.repository import token_list, add_token, remove_tokens, nuke_tokens
+from pyflared.utils.asyncio.run import run
 
 token_manager = typer.Typer(help="Use for managing CLOUDFLARE_API_TOKEN")
 
@@ -18,7 +17,7 @@ def list_tokens() -> None:
     (Alias: ls)
     """
 
-    tokens = asyncio.run(token_list())
+    tokens = run(token_list())
     if not tokens:
         typer.echo("No keys found!")
         return
@@ -36,7 +35,7 @@ def add(
     Add CLOUDFLARE_API_TOKEN to manage tunnels and dns
     """
     token2 = Token(value=token, name=name)
-    if asyncio.run(add_token(token2)):
+    if run(add_token(token2)):
         typer.echo(f"Token added!")
     else:
         typer.echo(f"Token add Failed!")
@@ -52,7 +51,7 @@ def remove(
 
     (Alias: rm)
     """
-    if asyncio.run(remove_tokens(name)):
+    if run(remove_tokens(name)):
         typer.echo(f"Token '{name}' removed!")
     else:
         typer.secho(f"Token '{name}' not found in pool!", fg=typer.colors.YELLOW)
@@ -63,5 +62,5 @@ def nuke() -> None:
     """
     Nuke the token pool, removing all tokens.
     """
-    asyncio.run(nuke_tokens())
+    run(nuke_tokens())
     typer.echo(f"Token pool nuked!")
@@ -1,4 +1,3 @@
-import asyncio
 import logging
 import sys
 
@@ -13,6 +12,7 @@ from pyflared.api_sdk.parse import Mapping
 from pyflared.log.config import isolated_logging
 from pyflared.shared.console import err_console
 from pyflared.shared.types import OutputChannel
+from pyflared.utils.asyncio.run import run
 
 tunnel_manager = typer.Typer(help="Use for creating quick tunnels and dns mapped tunnel")
 
@@ -40,26 +40,26 @@ def display_tunnel_info(url: str) -> None:
 
 
 def print_all(line: bytes, _: OutputChannel):
-    err_console.print(line.decode())
+    # Raw passthrough: cloudflared lines need no markup parsing or highlighting, and already end in a newline
+    err_console.out(line.decode(), end="", highlight=False)
 
 
-def print_tunnel_box(line: bytes, _: OutputChannel):
-    already_printed = False  # This is because for Links that are not backed by a service, clicking it emits the same line again each time
+# Links that are not backed by a service make cloudflared emit the same URL line again on each click
+_printed_tunnel_urls = set[str]()
+
 
-    def output_result(url: str) -> None:
-        nonlocal already_printed
-        if already_printed:
-            return
-        if sys.stdout.isatty():
-            # If a human is watching, show the pretty panel
-            display_tunnel_info(url)
-        else:
-            # If the user is piping output (e.g., > file.txt), just print the raw URL
-            err_console.print(url)
-            # print(url)
-        already_printed = True
+def print_tunnel_box(line: bytes, _: OutputChannel):
+    url = line.decode().strip()
+    if url in _printed_tunnel_urls:
+        return
+    _printed_tunnel_urls.add(url)
 
-    output_result(line.decode().strip())
+    if sys.stdout.isatty():
+        # If a human is watching, show the pretty panel
+        display_tunnel_info(url)
+    else:
+        # If the user is piping output (e.g., > file.txt), just print the raw URL
+        err_console.print(url)
 
 
 @tunnel_manager.command("quick")
@@ -74,7 +74,7 @@ def quick_tunnel(
     """
     tunnel_process = pyflared.run_quick_tunnel(service)  # TODO: Fix it! we cannot run in bg and end
     with isolated_logging(logging.DEBUG if verbose else logging.INFO):
-        _ = asyncio.run(tunnel_process.start_background([print_tunnel_box]))
+        _ = run(tunnel_process.start_background([print_tunnel_box]))
 
 
 @tunnel_manager.command("cleanup")
@@ -103,7 +103,7 @@ def cleanup_tunnels_n_dns(
     # Set the logging context and execute the async cleanup,
     # passing the boolean so the backend knows the intended scope.
     with isolated_logging(logging.DEBUG if verbose else logging.INFO):
-        asyncio.run(cleanup(all_resources))
+        run(cleanup(all_resources))
 
 
 def pretty_tunnel_status(line: bytes, _: OutputChannel):
@@ -175,4 +175,4 @@ def mapped_tunnel(
             force=force,
         )
 
-        _ = asyncio.run(tunnel_process.start_background([pretty_tunnel_status]))
+        _ = run(tunnel_process.start_background([pretty_tunnel_status]))
@@ -1,5 +1,5 @@
-import asyncio
 import atexit
+import os
 import pathlib
 import re
 import stat
@@ -37,10 +37,13 @@ def _bin_dir():
 _binary_filename = f"cloudflared{".exe" if IS_WINDOWS else ""}"
 
 
-def _ensure_posix_executable(path: pathlib.Path) -> None:
-    if not IS_WINDOWS:
-        mode = path.stat().st_mode
-        path.chmod(mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+_EXEC_BITS = stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH
+
+
+def _ensure_posix_executable(path: pathlib.Path, mode: int) -> None:
+    # After the first run the bits are already there, so the chmod syscall is usually skipped
+    if not IS_WINDOWS and mode & _EXEC_BITS != _EXEC_BITS:
+        path.chmod(mode | _EXEC_BITS)
 
 
 def _get_files_recursively(entry: Traversable) -> Iterator[Traversable]:
@@ -48,6 +51,10 @@ def _get_files_recursively(entry: Traversable) -> Iterator[Traversable]:
     Recursively yield full string paths from a Traversable object.
     Works for both directories on disk and inside zips/wheels.
     """
+    if isinstance(entry, Path):  # On disk: os.walk sorts files from dirs with scandir, no stat per entry
+        for dir_path, _, file_names in os.walk(entry):
+            yield from (Path(dir_path, name) for name in file_names)
+        return
     if entry.is_dir():
         for child in entry.iterdir():
             yield from _get_files_recursively(child)
@@ -70,18 +77,22 @@ def binary_path() -> pathlib.Path:
 
     # 2. "Mount" the file
     # This guarantees 'path' is a real file system path (original or temp extracted).
-    path = global_exit_stack.enter_context(as_file(binary_ref))
+    # A regular on-disk install already hands back a Path, so only zipped installs need as_file's extraction
+    path = binary_ref if isinstance(binary_ref, Path) else global_exit_stack.enter_context(as_file(binary_ref))
 
     # 3. Validation (Now we treat it as a standard file)
-    if not path.exists():
+    # One stat answers both "does it exist" and "what mode does it have" for step 5
+    try:
+        mode = path.stat().st_mode
+    except FileNotFoundError:
         # Debugging helper: List what IS there to help solve the error
         children = list(_get_files_recursively(root))
         raise FileNotFoundError(
             f"Bundled binary not found at: {path}\nAvailable files: {children}"
-        )
+        ) from None
 
     # 5. Permissions (Linux/Mac specific)
-    _ensure_posix_executable(path)
+    _ensure_posix_executable(path, mode)
 
     return path
 
@@ -93,57 +104,59 @@ cloudflared = BinaryApp(binary_path)
 
 
 @cloudflared.instant()
-def binary_version(): return "version"
+def _binary_version(): return "version"
+
+
+_cached_binary_version: str | None = None
+
+
+async def binary_version() -> str:
+    # The bundled binary can't change under a running process, so cloudflared is exec'd for this at most once
+    global _cached_binary_version
+    if _cached_binary_version is None:
+        _cached_binary_version = await _binary_version()
+    return _cached_binary_version
 
 
 quickflare_url_pattern: re.Pattern[bytes] = re.compile(rb'(https://[a-zA-Z0-9-]+\.trycloudflare\.com)')
 
 
-async def filter_trycloudflare_url(stream_reader: asyncio.StreamReader, _: OutputChannel) -> Chunk:
-    line_data = await stream_reader.readline()
+def filter_trycloudflare_url(line_data: bytes, _: OutputChannel) -> Chunk:
     logger.opt(raw=True).debug(line_data.decode())
-    if match := quickflare_url_pattern.search(line_data):
+    # Plain substring scan rejects nearly every log line before the regex engine is involved
+    if b".trycloudflare.com" in line_data and (match := quickflare_url_pattern.search(line_data)):
         return match.group(1)
     return ChunkSignal.SKIP
 
 
-@cloudflared.daemon(stream_chunker=filter_trycloudflare_url)
+# cloudflared logs to stderr and none of the tunnel chunkers look at the channel, so one pipe carries it all
+@cloudflared.daemon(stream_chunker=filter_trycloudflare_url, merge_stderr=True)
 async def run_quick_tunnel(service: str):
-    return *quick_tunnel_cmd, service
+    return quick_tunnel_cmd + (service,)
 
 
 def confirm_token() -> bool:
     return True
 
 
-async def log_all_n_skip(stream_reader: asyncio.StreamReader, _: OutputChannel) -> Chunk:
-    line_data = await stream_reader.readline()
+def log_all_n_skip(line_data: bytes, _: OutputChannel) -> Chunk:
     logger.opt(raw=True).debug(line_data.decode())
     return ChunkSignal.SKIP
 
 
-x = "Registered tunnel connection connIndex="
-
-patterns = (starting_tunnel, config_pattern, tunnel_connection_pattern)
-
-# re.escape ensures special characters (like . or *) don't break the regex
-combined_pattern = re.compile(b"|".join(re.escape(p) for p in patterns))
-
-
-async def fixed_tunnel_tracing(stream_reader: asyncio.StreamReader, _: OutputChannel) -> Chunk:
-    line_data = await stream_reader.readline()
+def fixed_tunnel_tracing(line_data: bytes, _: OutputChannel) -> Chunk:
     logger.opt(raw=True).debug(line_data.decode())
     if starting_tunnel in line_data or tunnel_connection_pattern in line_data or config_pattern in line_data:
         return line_data
     return ChunkSignal.SKIP
 
 
-@cloudflared.daemon(stream_chunker=fixed_tunnel_tracing)
+@cloudflared.daemon(stream_chunker=fixed_tunnel_tracing, merge_stderr=True)
 def run_token_tunnel(token: str):
-    return *token_tunnel_cmd, token
+    return token_tunnel_cmd + (token,)
 
 
-@cloudflared.daemon(stream_chunker=fixed_tunnel_tracing)
+@cloudflared.daemon(stream_chunker=fixed_tunnel_tracing, merge_stderr=True)
 async def run_dns_fixed_tunnel(mappings: list[Mapping], tunnel_name: str | None = None, force: bool = False, ):
     """Create a DNS-mapped Cloudflare Tunnel for the given domain-to-service mappings.
 
@@ -168,7 +181,7 @@ async def run_dns_fixed_tunnel(mappings: list[Mapping], tunnel_name: str | None
     async with TunnelManager() as tm:
         running_tunnel = await tm.subdomain_mapped_tunnel(mappings, tunnel_name=tunnel_name, force=force)
         try:
-            yield *token_tunnel_cmd, running_tunnel.tunnel_token.get_secret_value()
+            yield token_tunnel_cmd + (running_tunnel.tunnel_token.get_secret_value(),)
         finally:
             if not tunnel_name:
                 await running_tunnel.clean_up()
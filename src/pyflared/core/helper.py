@@ -3,6 +3,7 @@ import socket
 from collections.abc import Awaitable, Iterable
 from dataclasses import dataclass
 from datetime import datetime, UTC
+from functools import cache
 from typing import Callable
 
 from cloudflare.types import CloudflareTunnel
@@ -11,7 +12,6 @@ from cloudflare.types.dns import RecordResponse, RecordBatchResponse
 from pyflared.api_sdk.tokenized_tunnel import TokenizedTunnel
 from pyflared.core.model import ZoneEntry
 from pyflared.shared import consts
-from pyflared.utils.type_check import is_of_type
 
 
 class All:
@@ -19,7 +19,17 @@ class All:
 
 
 ALL = All()
-temp_tags = (consts.api_managed_tag, consts.ephemeral)
+temp_tags = frozenset((consts.api_managed_tag, consts.ephemeral))
+
+
+@cache
+def _clean_hostname() -> str:
+    # Resolved once per process: gethostname is a syscall, and the cleaned name can't change between tunnels
+    # We split by '.' to handle FQDNs (e.g., 'server01.us-east.prod' -> 'server01')
+    raw_host = socket.gethostname().split('.')[0]
+
+    # Remove special chars to ensure CLI/API compatibility, keep underscores/hyphens
+    return re.sub(r'[^a-zA-Z0-9_-]', '-', raw_host).lower()
 
 
 def auto_tunnel_name() -> str:
@@ -29,11 +39,7 @@ def auto_tunnel_name() -> str:
     Example: 'macbook-pro_2026-01-09_16-30-05'
     """
     # 1. Get Hostname & Clean it
-    # We split by '.' to handle FQDNs (e.g., 'server01.us-east.prod' -> 'server01')
-    raw_host = socket.gethostname().split('.')[0]
-
-    # Remove special chars to ensure CLI/API compatibility, keep underscores/hyphens
-    clean_host = re.sub(r'[^a-zA-Z0-9_-]', '-', raw_host).lower()
+    clean_host = _clean_hostname()
 
     # 2. Get UTC Time (Consistent across all timezones)
     # Using specific format: Date and Time separated by underscore
@@ -43,21 +49,30 @@ def auto_tunnel_name() -> str:
     return f"{clean_host}_{human_timestamp}"
 
 
+_cfargotunnel_len = len(consts.cfargotunnel)
+
+
 def get_tunnel_id(record: RecordResponse) -> str | None:
-    return record.content.removesuffix(  # pyright: ignore[reportOptionalMemberAccess]
-        consts.cfargotunnel) if record.content.endswith(  # pyright: ignore[reportOptionalMemberAccess]
-        consts.cfargotunnel) else None
+    # Runs per DNS record: read the content once, and slice instead of a second suffix check in removesuffix
+    content = record.content
+    return content[:-_cfargotunnel_len] if content and content.endswith(consts.cfargotunnel) else None
+
+
+_DOWN_STATUSES = frozenset(("inactive", "down"))
 
 
 def tunnel_is_down(tunnel: CloudflareTunnel) -> bool:
-    return tunnel.status in ("inactive", "down")
+    return tunnel.status in _DOWN_STATUSES
 
 
 def tunnel_has_tags(tunnel: CloudflareTunnel, tags: Iterable[str]) -> bool:
+    # Runs for every tunnel of every scanned account: a bare `list` needs no beartype walk,
+    # and a tag set passed in (like temp_tags) is used as-is instead of being rebuilt per tunnel
+    required = tags if isinstance(tags, (set, frozenset)) else set(tags)
     return bool(
         isinstance(metadata := tunnel.metadata, dict)
-        and is_of_type(found_tags := metadata.get("tags"), list)
-        and set(tags).issubset(found_tags)
+        and isinstance(found_tags := metadata.get(consts.tags), list)
+        and required.issubset(found_tags)
     )
 
 
@@ -1,10 +1,12 @@
 # For low-level cloudflare requests
-from collections.abc import AsyncIterator, Iterable
-from contextlib import AsyncExitStack
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
 from types import TracebackType
 from typing import Any, Literal, Self, Unpack, Final
 
-from cloudflare import NOT_GIVEN, AsyncCloudflare, BadRequestError, NotGiven
+import httpx
+from cloudflare import NOT_GIVEN, AsyncCloudflare, BadRequestError, DefaultAsyncHttpxClient, NotGiven
+from cloudflare.pagination import AsyncV4PagePaginationArray
 from cloudflare.types import CloudflareTunnel
 from cloudflare.types.dns import RecordListParams, RecordResponse
 from cloudflare.types.zero_trust.tunnels.cloudflared import ConfigurationGetResponse
@@ -19,6 +21,38 @@ from pyflared.shared.types import RecordBatchParam
 
 tunnel_active_connection_error_code: Final[int] = 1022
 
+# The SDK default keeps only 20 idle connections alive for 5s; zone/DNS fan-outs run wider than that and come in
+# bursts a few seconds apart, so every burst past the 20th request paid a fresh TCP + TLS handshake
+_connection_limits: Final = httpx.Limits(max_connections=100, max_keepalive_connections=100, keepalive_expiry=60)
+
+
+type PageFetch[T] = Callable[[int], Awaitable[AsyncV4PagePaginationArray[T]]]
+
+
+async def prefetch_pages[T](fetch: PageFetch[T]) -> AsyncIterator[T]:
+    """
+    Every item of a page-numbered listing, in order. Page 1 reports how many pages there are, so the rest are
+    requested together rather than one round-trip after another; without that count, pages follow one by one.
+    """
+    first = await fetch(1)
+    total_pages: int | None = getattr(first.result_info, "total_pages", None)  # Declared by monkey_patch
+    if total_pages is None:
+        async for item in first:
+            yield item
+        return
+
+    rest = [asyncio.ensure_future(fetch(page)) for page in range(2, total_pages + 1)]
+    try:
+        for item in first.result or ():
+            yield item
+        for pending in rest:
+            for item in (await pending).result or ():
+                yield item
+    finally:  # Consumer stopped early or a page failed: don't leave the other requests running or unobserved
+        for pending in rest:
+            if not pending.cancel() and not pending.cancelled():
+                _ = pending.exception()
+
 
 # type JsonValue = int | float | str | bool | None | list["JsonValue"] | dict[str, "JsonValue"]
 # type JsonDict = dict[str, JsonValue]
@@ -27,35 +61,44 @@ tunnel_active_connection_error_code: Final[int] = 1022
 class CloudflareRequest:
 
     def __init__(self, client: AsyncCloudflare | None = None) -> None:
-        if client:
-            self._stack: AsyncExitStack | None = None
-            self.client: AsyncCloudflare = client
-        else:
-            self._stack = AsyncExitStack()
-            self.client = AsyncCloudflare()
+        # Only a client created here is entered/exited here; a passed-in one belongs to the caller
+        self._owns_client: bool = client is None
+        self.client: AsyncCloudflare = client or AsyncCloudflare(
+            http_client=DefaultAsyncHttpxClient(limits=_connection_limits))
+        self._tokenized_clients: dict[str, AsyncCloudflare] = {}
 
     async def __aenter__(self) -> Self:
-        if self._stack:
-            _ = await self._stack.enter_async_context(self.client)
+        if self._owns_client:
+            _ = await self.client.__aenter__()
         return self
 
     async def __aexit__(self, exc_type: type[BaseException] | None, exc_val: BaseException | None,
                         traceback: TracebackType | None, ) -> None:
-        if self._stack:
-            _ = await self._stack.__aexit__(exc_type, exc_val, traceback)
+        if self._owns_client:
+            _ = await self.client.__aexit__(exc_type, exc_val, traceback)
 
     def tokenized_client(self, token: str) -> AsyncCloudflare:
-        return self.client.with_options(api_token=token)
+        # with_options copies the whole client, and each copy rebuilds its resource tree on first use;
+        # the handful of tokens each get one copy, all sharing the same connection pool
+        if not (client := self._tokenized_clients.get(token)):
+            client = self._tokenized_clients[token] = self.client.with_options(api_token=token)
+        return client
 
     async def zones_list(
             self, token: str,
             status: Literal["initializing", "pending", "active", "moved"] | NotGiven = "active",
     ) -> AsyncIterator[Zone]:
-        async for zone in self.client.with_options(api_token=token).zones.list(status=status):
+        zones = self.tokenized_client(token).zones
+        async for zone in prefetch_pages(lambda page: zones.list(status=status, page=page)):
             yield zone
 
     async def dns_list(self, token: str, **kwargs: Unpack[RecordListParams]) -> AsyncIterator[RecordResponse]:
-        async for record in self.client.with_options(api_token=token).dns.records.list(**kwargs):
+        records = self.tokenized_client(token).dns.records
+        if "page" in kwargs:  # An explicit starting page keeps the SDK's own page-after-page walk from there
+            async for record in records.list(**kwargs):
+                yield record
+            return
+        async for record in prefetch_pages(lambda page: records.list(**{**kwargs, "page": page})):
             yield record
 
     # @copy_cf_signature(CloudflaredResource.list)
@@ -88,7 +131,7 @@ class CloudflareRequest:
         # Deletes, Patches(fix), Puts(replace whole), Posts(create)
         if not batch:
             raise Exception("No input provided!")
-        if result := await self.client.with_options(api_token=token).dns.records.batch(
+        if result := await self.tokenized_client(token).dns.records.batch(
                 zone_id=batch.zone.id, posts=batch.creates, deletes=batch.deletes,
                 puts=batch.replace, patches=batch.edit):
             logger.debug(f"Batch creation result: {Pretty(result.model_dump())}")
@@ -98,8 +141,9 @@ class CloudflareRequest:
 
     async def tunnels_list(
             self, token: str, *, account_id: str, name: str | None = None) -> AsyncIterator[CloudflareTunnel]:
-        async for tunnel in self.client.with_options(api_token=token).zero_trust.tunnels.cloudflared.list(
-                account_id=account_id, is_deleted=False, name=name or NOT_GIVEN):
+        tunnels = self.tokenized_client(token).zero_trust.tunnels.cloudflared
+        async for tunnel in prefetch_pages(lambda page: tunnels.list(
+                account_id=account_id, is_deleted=False, name=name or NOT_GIVEN, page=page)):
             yield tunnel  # pyright: ignore[reportReturnType]
 
     async def create_tunnel(
@@ -121,7 +165,7 @@ class CloudflareRequest:
         if metadata:
             payload["metadata"] = metadata
 
-        response = await self.client.with_options(api_token=api_token).post(
+        response = await self.tokenized_client(api_token).post(
             create_tunnel_endpoint,
             body=payload,
             cast_to=dict[str, Any]
@@ -130,15 +174,14 @@ class CloudflareRequest:
 
     async def update_tunnel_ingress(
             self, token: str, tunnel_id: str, account_id: str, ingresses: Iterable[ConfigIngress]):
-        _ = await self.client.with_options(api_token=token).zero_trust.tunnels.cloudflared.configurations.update(
+        _ = await self.tokenized_client(token).zero_trust.tunnels.cloudflared.configurations.update(
             tunnel_id=tunnel_id, account_id=account_id, config=Config(ingress=ingresses)
         )
 
     async def tunnel_configurations(self, token: str, tunnel_id: str,
                                     account_id: str, ) -> ConfigurationGetResponse:
-        if configuration := await self.client.with_options(
-                api_token=token).zero_trust.tunnels.cloudflared.configurations.get(
-            tunnel_id=tunnel_id, account_id=account_id):
+        if configuration := await self.tokenized_client(token).zero_trust.tunnels.cloudflared.configurations.get(
+                tunnel_id=tunnel_id, account_id=account_id):
             return configuration
         else:
             raise Exception("No configuration found!")
@@ -149,14 +192,14 @@ class CloudflareRequest:
 
     async def delete_tunnel(self, token: str, tunnel: CloudflareTunnel | TokenizedTunnel):
         logger.info(f"Deleting orphan tunnel: {tunnel.name}")
-        result = await self.client.with_options(api_token=token).zero_trust.tunnels.cloudflared.delete(
+        result = await self.tokenized_client(token).zero_trust.tunnels.cloudflared.delete(
             tunnel_id=tunnel.id, account_id=tunnel.account_tag)  # pyright: ignore[reportArgumentType]
         logger.debug(f"Deletion result: {Pretty(result.model_dump())}")
 
     async def cleanup_tunnel_connection(self, token: str, tunnel: CloudflareTunnel | TokenizedTunnel):
         # This is the binary API equivalent of `cloudflared tunnel cleanup`
         logger.info(f"Cleaning up ghost connections: {tunnel.name}")
-        result = await self.client.with_options(api_token=token).zero_trust.tunnels.cloudflared.connections.delete(
+        result = await self.tokenized_client(token).zero_trust.tunnels.cloudflared.connections.delete(
             tunnel_id=tunnel.id, account_id=tunnel.account_tag)  # pyright: ignore[reportArgumentType]
         logger.debug("Cleanup result: {}", Pretty(result))
 
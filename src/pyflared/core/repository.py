@@ -1,7 +1,6 @@
 import datetime
 import os
 import sqlite3
-from collections import defaultdict
 from collections.abc import Sequence
 from dataclasses import dataclass, field
 from functools import cache
@@ -1,16 +1,16 @@
 import asyncio
 from collections import defaultdict
 from collections.abc import Collection, Iterable, Sequence
-from contextlib import AsyncExitStack
 from functools import partial
+from itertools import chain
 from types import TracebackType
-from typing import Self
+from typing import Final, Self, Unpack
 
 import tldextract
 from cloudflare import PermissionDeniedError
 from cloudflare.types import CloudflareTunnel
 from cloudflare.types.dns import batch_put_param, record_batch_params, CNAMERecordParam, \
-    RecordBatchResponse
+    RecordBatchResponse, RecordListParams
 from cloudflare.types.zero_trust.tunnels.cloudflared.configuration_update_params import ConfigIngress
 from loguru import logger
 from pydantic import SecretStr
@@ -21,7 +21,7 @@ from pyflared.api_sdk.ingress import fix_ingress_order
 from pyflared.api_sdk.parse import Mapping
 from pyflared.api_sdk.tokenized_tunnel import TokenizedTunnel
 from pyflared.core.helper import auto_tunnel_name, get_tunnel_id, ConfiguredTunnel, tunnel_has_tags, \
-    tunnel_is_down, dns_has_tags, All, ALL, temp_tags
+    tunnel_is_down, All, ALL, temp_tags
 from pyflared.core.model import ZoneEntry, TokenLookupLink, Token
 from pyflared.core.network import CloudflareRequest
 from pyflared.core.repository import TokenHint, save_trial, add_token, engine, \
@@ -30,13 +30,16 @@ from pyflared.shared import consts
 from pyflared.shared.console import Pretty
 from pyflared.shared.types import RecordBatchParam, delify_response
 from pyflared.utils.run_failover import run_failover
-from pyflared.utils.asyncio.async_Iterable import yield_from_async
+from pyflared.utils.asyncio.async_Iterable import collect, yield_from_async
 from pyflared.utils.set import set_remove
 
 type DomainSubDomainMapping = defaultdict[str, set[str]]  # Domain -> subdomains
 
 _extract = tldextract.TLDExtract(include_psl_private_domains=True)
 
+# Up to this many requested names per zone, exact-name lookups (run concurrently) beat paging through the zone
+_exact_name_lookup_limit: Final[int] = 10
+
 
 def domain_from_subdomain(cname: str) -> str:
     return _extract(cname).top_domain_under_public_suffix
@@ -46,25 +49,21 @@ class TunnelService:
     def __init__(self, cloudflare_request: CloudflareRequest | None = None) -> None:
         self.token_hint: TokenHint = TokenHint()
 
-        if cloudflare_request:
-            self._stack: AsyncExitStack | None = None
-            self.cloudflare_request: CloudflareRequest = cloudflare_request
-        else:
-            self._stack = AsyncExitStack()
-            self.cloudflare_request = CloudflareRequest()
+        self._owns_cloudflare_request: bool = cloudflare_request is None
+        self.cloudflare_request: CloudflareRequest = cloudflare_request or CloudflareRequest()
 
     async def refresh_tokens(self):
         await self.token_hint.refresh()
 
     async def __aenter__(self) -> Self:
-        if self._stack:
-            _ = await self._stack.enter_async_context(self.cloudflare_request)
+        if self._owns_cloudflare_request:
+            _ = await self.cloudflare_request.__aenter__()
         return self
 
     async def __aexit__(self, exc_type: type[BaseException] | None, exc_val: BaseException | None,
                         traceback: TracebackType | None, ) -> None:
-        if self._stack:
-            _ = await self._stack.__aexit__(exc_type, exc_val, traceback)
+        if self._owns_cloudflare_request:
+            _ = await self.cloudflare_request.__aexit__(exc_type, exc_val, traceback)
 
     @yield_from_async
     def tunnel_list(self, account_id: str, name: str | None = None):
@@ -73,9 +72,9 @@ class TunnelService:
         return run_failover(runner, tokens)
 
     @yield_from_async
-    def dns_list(self, zone_id: str):
-        tokens = self.token_hint.priority_tokens(zone_id)
-        runner = partial(self.cloudflare_request.dns_list, zone_id=zone_id)
+    def dns_list(self, **params: Unpack[RecordListParams]):
+        tokens = self.token_hint.priority_tokens(params["zone_id"])
+        runner = partial(self.cloudflare_request.dns_list, **params)
         return run_failover(runner, tokens)
 
     async def dns_edit(self, batch_param: RecordBatchParam):
@@ -144,7 +143,8 @@ class TunnelService:
         await run_failover(runner, tokens, on_complete=oncomplete)
 
     async def sync_db(self):  # Update from API
-        zones = list[ZoneEntry]()
+        # Zone name -> entry: tokens overlap, and a zone seen through several of them is still one zone to walk
+        zones = dict[str, ZoneEntry]()
 
         # links: LinkMemory = {}
         async def sync_zones_from_token(token: Token, save_token: bool = False):
@@ -164,7 +164,7 @@ class TunnelService:
                         domain = ze.name
 
                         session.add(ze)
-                        zones.append(ze)
+                        _ = zones.setdefault(domain, ze)
 
                         lookup_link = TokenLookupLink(token_value=token.value, search_key=domain)
                         session.add(lookup_link)
@@ -201,7 +201,7 @@ class TunnelService:
                     _ = tg.create_task(sync_zones_from_token(token))
 
         await body()
-        return zones
+        return list(zones.values())
 
     async def get_zones(self, domains: Collection[str] | None = None) -> Sequence[ZoneEntry]:
         """
@@ -248,22 +248,18 @@ class TunnelManager:
     # tunnel_service: TunnelService = field(default_factory=TunnelService)
 
     def __init__(self, tunnel_service: TunnelService | None = None) -> None:
-        if tunnel_service:
-            self._stack: AsyncExitStack | None = None
-            self.tunnel_service: TunnelService = tunnel_service
-        else:
-            self._stack = AsyncExitStack()
-            self.tunnel_service = TunnelService()
+        self._owns_tunnel_service: bool = tunnel_service is None
+        self.tunnel_service: TunnelService = tunnel_service or TunnelService()
 
     async def __aenter__(self) -> Self:
-        if self._stack:
-            _ = await self._stack.enter_async_context(self.tunnel_service)
+        if self._owns_tunnel_service:
+            _ = await self.tunnel_service.__aenter__()
         return self
 
     async def __aexit__(self, exc_type: type[BaseException] | None, exc_val: BaseException | None,
                         traceback: TracebackType | None, ) -> None:
-        if self._stack:
-            _ = await self._stack.__aexit__(exc_type, exc_val, traceback)
+        if self._owns_tunnel_service:
+            _ = await self.tunnel_service.__aexit__(exc_type, exc_val, traceback)
 
     # We won't do any tunnel clean here, as temp tunnel is meant ot be cleaned up on shutdown,
     # if some orphan is created by abrupt shutdown, it can be cleaned up by remove orphans command
@@ -276,16 +272,17 @@ class TunnelManager:
             epimeral: bool,  # when tunnel_id is none, this parameter is ignored
             force: bool = False,  # Typically named and active tunnels are respected, if Ture, it won't respect them
     ):
-        # Many zones have the same account, this is to prevent the same account repeat check
-        scanned_account = set[str]()
+        # Many zones have the same account: one scan task per account, which every zone of that account awaits.
+        # (A plain "already scanned" set let the second zone skip ahead while the scan was still filling
+        # protected_tunnels.)
+        account_scans = dict[str, asyncio.Task[None]]()
         # These are protected tunnels, we cannot delete them, when force is provided, this is empty, meaning all tunnels will be cleanup
         protected_tunnels = set[str]()
 
         async def scan_tunnels(aid: str):
-            if aid in scanned_account:
+            if force and tunnel_id:
+                # Forced mapping: nothing is protected and nothing is deleted, so the account's listing goes unused
                 return
-            scanned_account.add(aid)
-
             async with asyncio.TaskGroup() as tg:
                 async for tunnel in self.tunnel_service.tunnel_list(aid):
                     if force or (tunnel_is_down(tunnel) and tunnel_has_tags(tunnel, temp_tags)):
@@ -305,8 +302,26 @@ class TunnelManager:
             # comment = f"{consts.api_managed_tag},{consts.ephemeral if epimeral else ""}"
             content = f"{tunnel_id}{consts.cfargotunnel}"
 
-            async for record in self.tunnel_service.dns_list(zone.id):
-                if not zone_domains or set_remove(zone_domains, record.name):
+            # Listing the zone doesn't depend on the account scan, only judging its records does,
+            # so the records are fetched while the scan is still running
+            if zone_domains is None:
+                # A sweep of the whole zone only ever touches tunnel CNAMEs, so let the API drop everything else
+                listed = await collect(self.tunnel_service.dns_list(
+                    zone_id=zone.id, type="CNAME", content={"endswith": consts.cfargotunnel}))
+            elif len(zone_domains) <= _exact_name_lookup_limit:
+                # A handful of names: look each one up exactly (any record type, to catch a non-tunnel holder)
+                # rather than paging through every record in the zone
+                per_name = await asyncio.gather(*(
+                    collect(self.tunnel_service.dns_list(zone_id=zone.id, name={"exact": name}))
+                    for name in zone_domains))
+                listed = list(chain.from_iterable(per_name))
+            else:
+                listed = await collect(self.tunnel_service.dns_list(zone_id=zone.id))
+            await account_scans[zone.account_id]
+            for record in listed:
+                # `is None`, not falsiness: set_remove empties the set as names are matched, and an emptied set
+                # must not turn into "every record in the zone" for the records that follow
+                if zone_domains is None or set_remove(zone_domains, record.name):
                     if tid := get_tunnel_id(record):  # We only touch if it's connected to tunnel
                         if (
                                 # dns_has_tags(record, temp_tags) or
@@ -351,15 +366,14 @@ class TunnelManager:
                 zone_response = await self.tunnel_service.dns_edit(zone_records)
                 responses.append((zone, zone_response))
 
-        async def each_zone(zone: ZoneEntry):
-            await scan_tunnels(zone.account_id)
-            await set_zone_dns(zone)
-
         async def body():  # to prevent hint clash
             async with asyncio.TaskGroup() as tg:
                 # zones = await smart_cache.zone_memory
                 for zone in zones:
-                    _ = tg.create_task(each_zone(zone))
+                    # Each zone waits only for its own account's scan, not for every account's
+                    if (aid := zone.account_id) not in account_scans:
+                        account_scans[aid] = tg.create_task(scan_tunnels(aid))
+                    _ = tg.create_task(set_zone_dns(zone))
 
         await body()
         return responses
@@ -464,10 +478,19 @@ class TunnelManager:
 
         async def clean_up():
             logger.info(f"Cleaning up tunnel: {tunnel.name}")
-            await self.tunnel_service.force_delete_tunnel(tunnel)
-            async with asyncio.TaskGroup() as tg:
-                for response in responses:
-                    _ = tg.create_task(self.tunnel_service.dns_edit(delify_response(*response)))
+            # Tunnel and DNS deletions are independent requests, so they share one round-trip window.
+            # gather rather than a TaskGroup: one failed deletion must not cancel the others and strand records
+            results = await asyncio.gather(
+                self.tunnel_service.force_delete_tunnel(tunnel),
+                *(self.tunnel_service.dns_edit(delify_response(*response)) for response in responses),
+                return_exceptions=True,
+            )
+            errors = [result for result in results if isinstance(result, BaseException)]
+            for error in errors:  # A cancelled deletion means the cleanup itself is being cancelled
+                if isinstance(error, asyncio.CancelledError):
+                    raise error
+            if errors:  # Collapses to a plain ExceptionGroup when every error is an Exception
+                raise BaseExceptionGroup(f"Failed to clean up tunnel: {tunnel.name}", errors)
             logger.info(f"Cleaned up tunnel: {tunnel.name}")
 
         return ConfiguredTunnel(tunnel, responses, clean_up)
@@ -1,7 +1,10 @@
 import logging
 import sys
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from contextvars import ContextVar
 from pathlib import Path
-from typing import TYPE_CHECKING, Final
+from typing import TYPE_CHECKING, Final, TextIO
 
 from loguru import logger
 from platformdirs import user_log_dir
@@ -10,12 +13,17 @@ from pyflared.log.intercept import InterceptHandler
 from pyflared.shared.contants import APP_NAME, AUTHOR
 
 if TYPE_CHECKING:
-    from loguru import Record
+    from loguru import Message, Record
 
 CONSOLE_DEFAULT_LEVEL = logging.INFO
 
 CONTEXT_MIN_LEVEL: Final[str] = "min_level"
 
+# Lowest level any isolated_logging scope has asked for; records below it can't pass whatever the context says
+_lowest_console_level: int = CONSOLE_DEFAULT_LEVEL
+# Level of the innermost isolated_logging scope, None outside any
+_isolated_level: ContextVar[int | None] = ContextVar("_isolated_level", default=None)
+
 
 def console_filter(record: "Record") -> bool:
     """
@@ -24,6 +32,8 @@ def console_filter(record: "Record") -> bool:
     # 1. Extract level (Record.level is a generic object, but we know it has .no)
     # We cast or access safely. Loguru's Record 'level' attribute has a 'no' property.
     current_level_no: int = record["level"].no
+    if current_level_no < _lowest_console_level:  # The bulk of DEBUG traffic stops here, before the extra lookup
+        return False
 
     # 2. Extract context override
     # Record["extra"] returns a dict, so .get() is valid
@@ -35,12 +45,52 @@ def console_filter(record: "Record") -> bool:
     return current_level_no >= CONSOLE_DEFAULT_LEVEL
 
 
-def isolated_logging(level: int = logging.DEBUG):
+def isolated_logging(level: int = logging.DEBUG) -> AbstractContextManager[None]:
     """
     Context manager that uses the shared Constant Key.
     """
-    # kwargs unpacking is safe here because we use the constant key
-    return logger.contextualize(**{CONTEXT_MIN_LEVEL: level})
+    if level == CONSOLE_DEFAULT_LEVEL and _isolated_level.get() is None:
+        # console_filter already falls back to this level; skipping contextualize spares every record the context merge.
+        # Only outside another isolation, which would otherwise leak its level into this scope
+        return nullcontext()
+    global _lowest_console_level
+    _lowest_console_level = min(_lowest_console_level, level)
+    return _isolation(level)
+
+
+@contextmanager
+def _isolation(level: int) -> Iterator[None]:
+    token = _isolated_level.set(level)
+    try:
+        # kwargs unpacking is safe here because we use the constant key
+        with logger.contextualize(**{CONTEXT_MIN_LEVEL: level}):
+            yield
+    finally:
+        _isolated_level.reset(token)
+
+
+class SizeRotation:
+    """
+    Same rule as loguru's `rotation="10 MB"`, with the file size tracked in memory.
+    Loguru's own check seeks to the end of the file for every record, so each record cost an lseek()
+    on top of its write().
+    """
+    __slots__ = ("_limit", "_file", "_size")
+
+    def __init__(self, limit: int) -> None:
+        self._limit = limit
+        self._file: TextIO | None = None
+        self._size = 0
+
+    def __call__(self, message: "Message", file: TextIO) -> bool:
+        if file is not self._file:  # First record, or a new file after rotation: measure once
+            self._file = file
+            self._size = file.seek(0, 2)
+        self._size += len(message)
+        if self._size > self._limit:
+            self._file = None
+            return True
+        return False
 
 
 logger.remove()
@@ -51,29 +101,41 @@ _ = logger.add(
     format="<green>{time:HH:mm:ss}</green> | <level>{level: <8}</level> | <level>{message}</level>",
     level=logging.NOTSET,
     filter=console_filter,
-    colorize=True
+    colorize=None,  # Loguru checks for a TTY once; piped output (CI, systemd) skips the ANSI colouring
 )
 
+# No mkdir here: loguru's file sink runs makedirs(exist_ok=True) itself when it opens the file
 log_dir = Path(user_log_dir(APP_NAME, AUTHOR))
-log_dir.mkdir(parents=True, exist_ok=True)
 log_file = log_dir / "tunnel.log"
 
 # SINK 2: File
+# Every cloudflared line lands here at DEBUG; enqueue hands formatting, writes and rotation to loguru's worker thread
 _ = logger.add(
     log_file,
     format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {message}",
     level=logging.DEBUG,
-    rotation="10 MB",
-    compression="zip"
+    rotation=SizeRotation(10 * 1000 ** 2),  # "10 MB" in loguru's units
+    compression="zip",
+    enqueue=True,
+    # Left line-buffered (loguru's default): a daemon killed mid-run must not lose its last records, errors included
 )
 
 # --- Bridge Standard Logging to Loguru ---
 
 # 1. Hijack the Root Logger.
-# level=0 (NOTSET) ensures we don't drop any logs before Loguru sees them.
+# level=DEBUG matches the lowest level any Loguru sink accepts (the file sink), so nothing Loguru would keep is
+# dropped, while TRACE-style records below it are refused in isEnabledFor before a LogRecord is even built.
 # force=True removes any existing standard logging handlers.
 logging.basicConfig(
-    handlers=[InterceptHandler()], level=0, force=True)  # This hijacks everything from logging to loguru
+    handlers=[InterceptHandler()], level=logging.DEBUG, force=True)  # This hijacks everything from logging to loguru
+
+# LogRecords only live long enough for InterceptHandler to forward them; loguru finds the caller frame,
+# thread and process on its own, so skip the stdlib's per-record stack walk and lookups for them
+# (see "Optimization" in the logging HOWTO)
+logging._srcfile = None  # pyright: ignore[reportPrivateUsage]
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
 
 # 2. Ensure SQLAlchemy specifically emits its queries at INFO
 # so our InterceptHandler can catch and downgrade them to DEBUG.
@@ -78,3 +78,8 @@ async def safe_paginator_with_setup[T](
     # Proxy the remainder of the items seamlessly
     async for item in iterator:
         yield item
+
+
+async def collect[T](iterable: AsyncIterable[T]) -> list[T]:
+    """Drains an AsyncIterable into a list, as a coroutine that can be gathered."""
+    return [item async for item in iterable]
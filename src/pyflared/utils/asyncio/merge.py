@@ -1,12 +1,15 @@
 import asyncio
+from collections import deque
 from collections.abc import AsyncIterable, AsyncIterator
-from typing import final
+from enum import Enum
+from typing import Final, final
 
 
-class StopSentinel: pass
+class StopSentinel(Enum):  # Single-member enum, so `is` checks narrow the type
+    STOP = object()
 
 
-STOP_SIGNAL = StopSentinel()
+STOP_SIGNAL: Final = StopSentinel.STOP
 
 
 @final
@@ -15,12 +18,13 @@ class StreamError:
         self.error = error
 
 
-async def merge_async_iterators[T](*iterables: AsyncIterable[T]) -> AsyncIterator[T]:
+async def merge_async_iterators[T](*iterables: AsyncIterable[T], maxsize: int = 1024) -> AsyncIterator[T]:
     """
     Safely merges multiple AsyncIterables concurrently.
 
     Parameters:
         *iterables: The asynchronous iterables to combine.
+        maxsize: How many items producers may run ahead of the consumer before they block (backpressure).
     """
     if not iterables:
         raise ValueError("At least one iterable is required.")
@@ -30,31 +34,55 @@ async def merge_async_iterators[T](*iterables: AsyncIterable[T]) -> AsyncIterato
             yield i
         return
 
-    queue: asyncio.Queue[T | StreamError | StopSentinel] = asyncio.Queue(maxsize=len(iterables))
+    # A deque plus two flags instead of asyncio.Queue: no per-item put/get coroutines, unfinished-task bookkeeping
+    # or getter futures; producers only park on `has_room` when full, the consumer on `has_items` when empty
+    buffer: deque[T | StreamError | StopSentinel] = deque()
+    has_items = asyncio.Event()
+    has_room = asyncio.Event()
+    has_room.set()
     active_tasks: int = len(iterables)
 
+    async def put(item: T | StreamError | StopSentinel) -> None:
+        while len(buffer) >= maxsize:
+            has_room.clear()
+            _ = await has_room.wait()
+        buffer.append(item)
+        has_items.set()
+
     # gen is now typed as AsyncIterable to match the parameters
     async def consume(gen: AsyncIterable[T]) -> None:
         try:
             async for i in gen:
-                await queue.put(i)
+                if len(buffer) >= maxsize:
+                    await put(i)
+                else:  # Fast path, no coroutine per item
+                    buffer.append(i)
+                    has_items.set()
         except asyncio.CancelledError:
             raise
         except Exception as e:
-            await queue.put(StreamError(e))
-
-        await queue.put(STOP_SIGNAL)
+            # The consumer raises on this and never reads further, so no STOP_SIGNAL behind it
+            await put(StreamError(e))
+        else:
+            await put(STOP_SIGNAL)
 
     async with asyncio.TaskGroup() as tg:
         for g in iterables:
             _ = tg.create_task(consume(g))
 
         while active_tasks > 0:
-            item = await queue.get()
+            if not buffer:
+                has_items.clear()
+                _ = await has_items.wait()
+                continue
+
+            item = buffer.popleft()
+            has_room.set()
 
-            if isinstance(item, StopSentinel):
+            # Identity / exact-type checks instead of an isinstance MRO walk per item
+            if item is STOP_SIGNAL:
                 active_tasks -= 1
-            elif isinstance(item, StreamError):
+            elif type(item) is StreamError:
                 raise item.error
             else:
                 yield item
@@ -0,0 +1,13 @@
+import asyncio
+from collections.abc import Coroutine
+from typing import Any
+
+try:  # Optional speed-up (`pip install pyflared[fast]`); libuv's loop is not available on Windows
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+def run[T](main: Coroutine[Any, Any, T]) -> T:  # pyright: ignore[reportExplicitAny]
+    """asyncio.run, on uvloop's event loop when it is installed."""
+    return asyncio.run(main, loop_factory=uvloop and uvloop.new_event_loop)
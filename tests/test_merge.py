@@ -0,0 +1,37 @@
+# SPDX-FileCopyrightText: 2025-present Azmain <azmainmahatab012@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+"""Pytest suite for merge_async_iterators - every item once, per-source order kept, errors surfaced."""
+
+import asyncio
+from collections.abc import AsyncIterator
+
+import pytest
+
+from pyflared.utils.asyncio.merge import merge_async_iterators
+
+
+async def _source(name: str, count: int, delay: float = 0) -> AsyncIterator[str]:
+    for i in range(count):
+        if delay:
+            await asyncio.sleep(delay)
+        yield f"{name}{i}"
+
+
+async def _failing() -> AsyncIterator[str]:
+    yield "ok"
+    raise RuntimeError("boom")
+
+
+@pytest.mark.parametrize("maxsize", [pytest.param(1, id="tight"), pytest.param(1024, id="default")])
+async def test_merge_keeps_every_item_in_source_order(maxsize: int):
+    merged = [i async for i in merge_async_iterators(_source("a", 50), _source("b", 30, 0.0001), maxsize=maxsize)]
+    assert sorted(merged) == sorted([f"a{i}" for i in range(50)] + [f"b{i}" for i in range(30)])
+    assert [i for i in merged if i[0] == "a"] == [f"a{i}" for i in range(50)]
+    assert [i for i in merged if i[0] == "b"] == [f"b{i}" for i in range(30)]
+
+
+async def test_merge_raises_source_error():
+    with pytest.raises(ExceptionGroup) as info:
+        _ = [i async for i in merge_async_iterators(_failing(), _source("a", 3))]
+    assert info.group_contains(RuntimeError, match="boom")
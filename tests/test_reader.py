@@ -0,0 +1,99 @@
+# SPDX-FileCopyrightText: 2025-present Azmain <azmainmahatab012@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+"""Pytest suite for read_lines - must yield exactly what `async for line in stream` yields."""
+
+import asyncio
+from types import SimpleNamespace
+from typing import cast
+
+import pytest
+
+from pyflared.binary.reader import READ_CHUNK_SIZE, READ_LIMIT, channel_output, read_lines, reader_chunker
+from pyflared.binary.writer import ProcessWriter
+from pyflared.shared.types import ChunkSignal, OutputChannel
+
+
+def _stream(*feeds: bytes) -> asyncio.StreamReader:
+    stream = asyncio.StreamReader(limit=READ_LIMIT)  # The reference readline gets the same line limit as read_lines
+    for data in feeds:
+        stream.feed_data(data)
+    stream.feed_eof()
+    return stream
+
+
+@pytest.mark.parametrize(
+    "feeds",
+    [
+        pytest.param((), id="empty"),
+        pytest.param((b"one\n",), id="single_line"),
+        pytest.param((b"one\ntwo\nthree\n",), id="many_lines_one_feed"),
+        pytest.param((b"on", b"e\ntw", b"o\n"), id="lines_split_across_feeds"),
+        pytest.param((b"one\ntail",), id="trailing_partial_line"),
+        pytest.param((b"\n\n",), id="blank_lines"),
+        pytest.param((b"crlf\r\nline\r\n",), id="crlf_kept"),
+        pytest.param((b"x" * (READ_CHUNK_SIZE * 2 + 17) + b"\n",), id="line_longer_than_one_read"),
+    ],
+)
+async def test_read_lines_matches_stream_iteration(feeds: tuple[bytes, ...]):
+    expected = [line async for line in _stream(*feeds)]
+    assert [line async for line in read_lines(_stream(*feeds))] == expected
+
+
+async def test_read_lines_small_chunk_size():
+    feeds = (b"alpha\nbe", b"ta\n" + b"x" * 10 + b"\ngamma",)
+    expected = [line async for line in _stream(*feeds)]
+    assert [line async for line in read_lines(_stream(*feeds), chunk_size=3)] == expected
+
+
+@pytest.mark.parametrize(
+    "feeds",
+    [
+        pytest.param((b"x" * 33 + b"\n",), id="line_over_limit"),
+        pytest.param((b"ok\n" + b"x" * 20, b"x" * 20 + b"\n"), id="tail_grows_over_limit"),
+        pytest.param((b"x" * 100,), id="no_newline_at_all"),
+    ],
+)
+async def test_read_lines_rejects_lines_over_limit(feeds: tuple[bytes, ...]):
+    with pytest.raises(ValueError):
+        _ = [line async for line in read_lines(_stream(*feeds), chunk_size=8, limit=32)]
+
+
+async def test_read_lines_accepts_line_at_limit():
+    expected = b"x" * 32 + b"\n"  # Like readline, the newline doesn't count towards the limit
+    assert [line async for line in read_lines(_stream(expected), chunk_size=8, limit=32)] == [expected]
+
+
+async def _async_chunker(line: bytes, _: OutputChannel):
+    return line
+
+
+def _sync_chunker(line: bytes, _: OutputChannel):
+    return ChunkSignal.EOF if line == b"b\n" else ChunkSignal.SKIP
+
+
+@pytest.mark.parametrize(
+    ("chunker", "expected"),
+    [
+        pytest.param(_async_chunker, [b"a\n", b"b\n"], id="coroutine_chunker"),
+        pytest.param(_sync_chunker, [], id="plain_chunker"),
+    ],
+)
+async def test_reader_chunker(chunker, expected: list[bytes]):
+    chunks = reader_chunker(_stream(b"a\nb\n"), OutputChannel.STDOUT, chunker)
+    assert [chunk async for chunk in chunks] == expected
+
+
+def _failing_on_stderr(line: bytes, channel: OutputChannel):
+    if channel is OutputChannel.STDERR:
+        raise ValueError("bad stderr line")
+    return line
+
+
+async def test_channel_output_surfaces_drainer_failure():
+    stdout = asyncio.StreamReader()  # Never reaches EOF, like a child blocked on its full stderr pipe
+    process = SimpleNamespace(stdout=stdout, stderr=_stream(b"oops\n"))
+    writer = ProcessWriter(cast(asyncio.subprocess.Process, process))
+    with pytest.raises(ValueError, match="bad stderr line"):
+        async with asyncio.timeout(1):
+            _ = [chunk async for chunk in channel_output(writer, OutputChannel.STDOUT, chunker=_failing_on_stderr)]
@@ -0,0 +1,50 @@
+# SPDX-FileCopyrightText: 2025-present Azmain <azmainmahatab012@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+"""Pytest suite for TunnelManager._configure_dns - only the requested records are touched."""
+
+from collections import defaultdict
+from types import SimpleNamespace
+from typing import cast
+
+from pyflared.core.model import ZoneEntry
+from pyflared.core.tunnel_manager import DomainSubDomainMapping, TunnelManager, TunnelService, _exact_name_lookup_limit
+from pyflared.shared.types import RecordBatchParam
+
+_zone = ZoneEntry(name="example.com", id="zone", account_id="account")
+
+
+class _StubService:
+    def __init__(self, *records: SimpleNamespace) -> None:
+        self.records = records
+        self.batches: list[RecordBatchParam] = []
+
+    async def tunnel_list(self, aid: str, name: str | None = None):
+        for tunnel in ():
+            yield tunnel
+
+    async def dns_list(self, **_: object):
+        for record in self.records:
+            yield record
+
+    async def dns_edit(self, batch_param: RecordBatchParam):
+        self.batches.append(batch_param)
+        return SimpleNamespace()
+
+
+async def test_configure_dns_leaves_unrequested_tunnel_records_alone():
+    # More names than the exact-lookup limit, so the whole zone is listed; the unrelated tunnel CNAME comes last,
+    # after every requested name has already been matched
+    requested = [f"app{i}.example.com" for i in range(_exact_name_lookup_limit + 1)]
+    records = [SimpleNamespace(id=name, name=name, content="old.cfargotunnel.com") for name in requested]
+    records.append(SimpleNamespace(id="other", name="other.example.com", content="other.cfargotunnel.com"))
+    service = _StubService(*records)
+
+    mapping: DomainSubDomainMapping = defaultdict(set, {_zone.name: set(requested)})
+    _ = await TunnelManager(cast(TunnelService, service))._configure_dns(
+        zones=[_zone], domain_subdomain_mapping=mapping, tunnel_id="new", epimeral=True)
+
+    [batch] = service.batches
+    assert sorted(record["name"] for record in batch.replace) == sorted(requested)
+    assert not batch.creates
+    assert not batch.deletes